@@ -3,25 +3,29 @@
 A Python client for NASA's Earth Polychromatic Imaging Camera (EPIC) API.
 """
 
-from .client import EpicApiClient
-from .models import (
-    AerosolImageMetadata,
-    AerosolImagesResponse,
-    AttitudeQuaternions,
-    AvailableDate,
-    AvailableDatesResponse,
-    CloudImageMetadata,
-    CloudImagesResponse,
-    Coordinates2D,
-    EnhancedImageMetadata,
-    EnhancedImagesResponse,
-    EpicImageMetadata,
-    ImageryCoordinates,
-    NaturalImageMetadata,
-    NaturalImagesResponse,
-    Position3D,
-)
-from .service import EpicApiService
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .client import EpicApiClient
+    from .models import (
+        AerosolImageMetadata,
+        AerosolImagesResponse,
+        AttitudeQuaternions,
+        AvailableDate,
+        AvailableDatesResponse,
+        CloudImageMetadata,
+        CloudImagesResponse,
+        Coordinates2D,
+        EnhancedImageMetadata,
+        EnhancedImagesResponse,
+        EpicImageMetadata,
+        ImageryCoordinates,
+        NaturalImageMetadata,
+        NaturalImagesResponse,
+        Position3D,
+    )
+    from .service import EpicApiService
 
 try:
     from ._version import version as __version__  # type: ignore[import-untyped,unused-ignore]
@@ -47,3 +51,27 @@ __all__ = [
     "NaturalImagesResponse",
     "Position3D",
 ]
+
+# Submodule defining each public name. They are imported on first access (PEP 562) so
+# importing the package, e.g. for __version__, does not pull in requests and pydantic.
+_LAZY_IMPORTS = {
+    "EpicApiClient": "client",
+    "EpicApiService": "service",
+    **{name: "models" for name in __all__ if name not in ("EpicApiClient", "EpicApiService")},
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its submodule on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the lazily imported public names alongside the module globals."""
+    return sorted({*globals(), *__all__})
@@ -2,28 +2,55 @@
 Command-line interface for the NASA EPIC API client.
 """
 
+import importlib.util
 import json
+import os
+import shutil
+import textwrap
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import closing
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Any
 
 import click
 from rich.console import Console
 from rich.table import Table
-
-try:
-    import boto3  # type: ignore
-
-    HAS_BOTO3 = True
-except ImportError:
-    HAS_BOTO3 = False
-    boto3 = None
+from rich.text import Text
 
 from earth_polychromatic_api.client import EpicApiClient
 from earth_polychromatic_api.service import EpicApiService
 
+# boto3 takes a noticeable share of startup time and is only needed for S3 uploads,
+# so it is imported on first use by _get_s3_client rather than at module import
+HAS_BOTO3 = importlib.util.find_spec("boto3") is not None
+boto3: Any = None
+
 console = Console()
 
+# Number of images fetched in parallel by default
+DEFAULT_CONCURRENCY = 8
+
+# Size of the blocks image downloads are copied to disk in
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Connections kept open by the shared S3 client, enough for parallel uploads
+S3_MAX_POOL_CONNECTIONS = 32
+
+# Longest caption shown in metadata tables; longer ones are cut at a word boundary
+TABLE_CAPTION_WIDTH = 40
+
+# Local filename prefixes for collections saved under a different name than the API's
+FILENAME_PREFIXES = {
+    "cloud": "epic_cloudfraction_",
+    "aerosol": "epic_aerosol_",
+}
+
+# Directory under the user cache directory holding cached metadata responses
+CACHE_DIR_NAME = "earth_polychromatic_api"
+
 
 def download_images_programmatic(
     date: str | None = None,
@@ -52,7 +79,7 @@ def download_images_programmatic(
     if not local_dir:
         local_dir = Path("nasa_epic_images")
 
-    date_str = date or (datetime.now(tz=timezone.utc) - timedelta(days=1)).strftime("%Y-%m-%d")
+    date_str = date or (datetime.now(tz=timezone.utc) - timedelta(days=1)).date().isoformat()
 
     # Get collection method
     client = EpicApiClient()
@@ -110,24 +137,13 @@ def _download_single_image(
 ) -> tuple[int, int]:
     """Download a single image and optionally upload to S3."""
     image_name = image_data["image"]
-
-    # Build filename based on collection
-    if collection == "cloud":
-        filename = f"epic_cloudfraction_{image_name.split('_')[-1]}.png"
-    elif collection == "aerosol":
-        filename = f"epic_aerosol_{image_name.split('_')[-1]}.png"
-    else:
-        filename = f"{image_name}.png"
+    filename = _image_filename(collection, image_name)
 
     # Download image
     image_url = client.build_image_url(collection, image_data["date"], image_name, "png")
     local_file = local_dir / filename
 
-    response = client.session.get(image_url)
-    response.raise_for_status()
-
-    with local_file.open("wb") as f:
-        f.write(response.content)
+    _fetch_image(client, image_url, local_file)
 
     downloaded = 1
     uploaded = 0
@@ -135,7 +151,7 @@ def _download_single_image(
     # Upload to S3 if requested
     if not local_only and HAS_BOTO3 and bucket:
         try:
-            s3_client = boto3.client("s3")
+            s3_client = _get_s3_client()
             s3_key = f"{collection}/{image_data['date'].split(' ')[0].replace('-', '/')}/{filename}"
             s3_client.upload_file(str(local_file), bucket, s3_key)
             uploaded = 1
@@ -146,28 +162,209 @@ def _download_single_image(
     return downloaded, uploaded
 
 
+def _default_cache_dir() -> Path | None:
+    """Return the directory metadata responses for past dates are cached in between runs.
+
+    Follows the XDG base directory spec, which says a relative XDG_CACHE_HOME must be
+    ignored. Returns None, disabling the cache, when no home directory can be determined,
+    as in containers run under a UID without a passwd entry.
+    """
+    xdg_cache_home = os.getenv("XDG_CACHE_HOME")
+    if xdg_cache_home and Path(xdg_cache_home).is_absolute():
+        return Path(xdg_cache_home) / CACHE_DIR_NAME
+
+    try:
+        return Path.home() / ".cache" / CACHE_DIR_NAME
+    except RuntimeError:
+        return None
+
+
+def _image_filename(collection: str, image_name: str) -> str:
+    """Build the local filename for an image, keeping only the timestamp for renamed collections."""
+    prefix = FILENAME_PREFIXES.get(collection)
+    if prefix is None:
+        return f"{image_name}.png"
+    return f"{prefix}{image_name.rpartition('_')[2]}.png"
+
+
+@lru_cache(maxsize=1)
+def _get_s3_client() -> Any:
+    """Return the S3 client shared by every upload in this process.
+
+    Creating a boto3 client resolves credentials and builds a connection pool, so one
+    thread-safe client is reused across images, commands and warm Lambda invocations.
+    """
+    global boto3
+    if boto3 is None:
+        import boto3  # type: ignore
+
+    from botocore.config import Config as BotoConfig  # type: ignore
+
+    config = BotoConfig(
+        max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+        retries={"max_attempts": 3, "mode": "standard"},
+    )
+    return boto3.client("s3", config=config)
+
+
+@lru_cache(maxsize=1)
+def _get_s3_transfer_config() -> Any:
+    """Return the transfer configuration for uploads made from the download worker pool.
+
+    Uploads already run in parallel on that pool, so each upload_file call transfers in its
+    calling thread instead of starting a transfer thread pool of its own. EPIC images sit
+    below the default 8 MiB multipart threshold and S3's 5 MiB minimum part size, so they
+    go out as a single PutObject either way.
+    """
+    from boto3.s3.transfer import TransferConfig  # type: ignore
+
+    return TransferConfig(use_threads=False)
+
+
+def _fetch_image(client: EpicApiClient, image_url: str, local_file: Path) -> None:
+    """Download a single image from the EPIC archive to a local file.
+
+    The body is copied from the raw response stream to disk in fixed-size blocks, so only
+    one block per download is held in memory. It is written to a ".part" file that only
+    replaces local_file once the whole body has arrived, so an interrupted download never
+    leaves a truncated image behind.
+    """
+    part_file = local_file.with_suffix(".part")
+    with closing(client.session.get(image_url, stream=True)) as response:
+        response.raise_for_status()
+        # Have urllib3 undo any Content-Encoding while reading from the socket
+        response.raw.decode_content = True
+
+        try:
+            with part_file.open("wb") as f:
+                shutil.copyfileobj(response.raw, f, length=DOWNLOAD_CHUNK_SIZE)
+        except BaseException:
+            part_file.unlink(missing_ok=True)
+            raise
+
+    part_file.replace(local_file)
+
+
 def get_date_range(
     start_date: str | None,
     end_date: str | None,
     days_back: int | None,
     date_range_days: int | None,
+    *,
+    now: datetime | None = None,
 ) -> tuple[str, str]:
-    """Calculate date range from parameters."""
+    """Calculate date range from parameters.
+
+    Relative ranges are resolved against ``now``, which defaults to the current UTC time.
+    """
     if start_date and end_date:
         return start_date, end_date
 
+    now = now or datetime.now(tz=timezone.utc)
+
     if days_back is not None or date_range_days is not None:
-        days_back = days_back or 1
+        # 0 days back is a valid request for a range ending today
+        days_back = 1 if days_back is None else days_back
         date_range_days = date_range_days or 1
-        end_dt = datetime.now(tz=timezone.utc) - timedelta(days=days_back)
+        end_dt = now - timedelta(days=days_back)
         start_dt = end_dt - timedelta(days=date_range_days - 1)
-        return start_dt.strftime("%Y-%m-%d"), end_dt.strftime("%Y-%m-%d")
+        return start_dt.date().isoformat(), end_dt.date().isoformat()
 
-    yesterday = datetime.now(tz=timezone.utc) - timedelta(days=1)
-    date_str = yesterday.strftime("%Y-%m-%d")
+    date_str = (now - timedelta(days=1)).date().isoformat()
     return date_str, date_str
 
 
+def _expand_date_range(start_date: str, end_date: str) -> list[str]:
+    """List every date from start_date to end_date inclusive, in YYYY-MM-DD format."""
+    start = datetime.strptime(start_date, "%Y-%m-%d").date()
+    end = datetime.strptime(end_date, "%Y-%m-%d").date()
+    return [
+        (start + timedelta(days=offset)).isoformat() for offset in range((end - start).days + 1)
+    ]
+
+
+def _shorten_caption(caption: str) -> str:
+    """Cut a caption to TABLE_CAPTION_WIDTH at a word boundary for table output.
+
+    Falls back to a hard cut of the same width when the first word alone is too long, so
+    the caption is never reduced to just the placeholder.
+    """
+    shortened = textwrap.shorten(caption, width=TABLE_CAPTION_WIDTH, placeholder="...")
+    if shortened == "...":
+        return caption[: TABLE_CAPTION_WIDTH - len("...")] + "..."
+    return shortened
+
+
+def _validate_date(ctx: click.Context, param: click.Parameter, value: str | None) -> str | None:
+    """Reject date options that are not in YYYY-MM-DD format."""
+    if value is None:
+        return None
+
+    try:
+        datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        msg = f"{value!r} is not a valid date, expected YYYY-MM-DD"
+        raise click.BadParameter(msg, ctx=ctx, param=param) from None
+
+    return value
+
+
+def _image_metadata(collection: str, image_date: str, response: Any) -> list[dict[str, Any]]:
+    """Flatten one date's typed response into metadata output rows."""
+    return [
+        {
+            "date": image_date,
+            "collection": collection,
+            "image_name": image.image,
+            "caption": image.caption,
+            "centroid_lat": image.centroid_coordinates.lat,
+            "centroid_lon": image.centroid_coordinates.lon,
+            "version": image.version,
+        }
+        for image in response.root
+    ]
+
+
+def _by_date_method(service: EpicApiService, collection: str) -> Callable[[str], Any]:
+    """Return the service's typed by-date method for a collection.
+
+    Shared by the threaded and --parallel metadata paths so both resolve collections alike.
+    """
+    service_methods = {
+        "natural": service.get_natural_by_date_typed,
+        "enhanced": service.get_enhanced_by_date_typed,
+        "aerosol": service.get_aerosol_by_date_typed,
+        "cloud": service.get_cloud_by_date_typed,
+    }
+    if collection not in service_methods:
+        msg = f"Unknown collection: {collection}"
+        raise ValueError(msg)
+    return service_methods[collection]
+
+
+# Service reused by every date a metadata worker process fetches, set by the initializer
+_worker_service: EpicApiService | None = None
+
+
+def _init_metadata_worker(cache_dir: Path | None) -> None:
+    """Create the per-process service for --parallel metadata workers."""
+    global _worker_service
+    _worker_service = EpicApiService(cache_dir=cache_dir)
+
+
+def _fetch_metadata_for_date(collection: str, image_date: str) -> list[dict[str, Any]]:
+    """Fetch and parse one date's metadata inside a worker process.
+
+    Only the plain output rows are sent back, so the parent never unpickles models.
+    """
+    if _worker_service is None:
+        msg = "Metadata worker used before _init_metadata_worker ran"
+        raise RuntimeError(msg)
+
+    response = _by_date_method(_worker_service, collection)(image_date)
+    return _image_metadata(collection, image_date, response)
+
+
 @click.group()
 @click.version_option()
 def main() -> None:
@@ -189,12 +386,20 @@ def main() -> None:
     help="Local directory (default: nasa_epic_images)",
 )
 @click.option("--local-only", is_flag=True, help="Download only, no S3")
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1, max=EpicApiClient.POOL_MAXSIZE),
+    default=DEFAULT_CONCURRENCY,
+    show_default=True,
+    help="Number of images to download in parallel, up to the HTTP connection pool size",
+)
 def download_images(
     date: str | None,
     collection: str,
     bucket: str | None,
     local_dir: Path | None,
     local_only: bool,
+    concurrency: int,
 ) -> None:
     """Download NASA EPIC images."""
     if not local_only and not bucket:
@@ -204,7 +409,7 @@ def download_images(
     if not local_dir:
         local_dir = Path("nasa_epic_images")
 
-    date_str = date or (datetime.now(tz=timezone.utc) - timedelta(days=1)).strftime("%Y-%m-%d")
+    date_str = date or (datetime.now(tz=timezone.utc) - timedelta(days=1)).date().isoformat()
 
     client = EpicApiClient()
 
@@ -229,50 +434,67 @@ def download_images(
     full_local_dir = local_dir / collection / date_path
     full_local_dir.mkdir(parents=True, exist_ok=True)
 
-    downloaded = 0
-    uploaded = 0
-
+    downloads = []
     for image_data in images:
         image_name = image_data["image"]
-
-        # Build filename based on collection
-        if collection == "cloud":
-            filename = f"epic_cloudfraction_{image_name.split('_')[-1]}.png"
-        elif collection == "aerosol":
-            filename = f"epic_aerosol_{image_name.split('_')[-1]}.png"
-        else:
-            filename = f"{image_name}.png"
-
-        # Download image
+        filename = _image_filename(collection, image_name)
         image_url = client.build_image_url(collection, image_data["date"], image_name, "png")
-        local_file = full_local_dir / filename
+        downloads.append((filename, image_url, full_local_dir / filename))
 
+    s3_client = None
+    if not local_only and bucket and HAS_BOTO3:
         try:
-            response = client.session.get(image_url)
-            response.raise_for_status()
+            s3_client = _get_s3_client()
+        except Exception as e:
+            console.print(f"❌ S3 upload failed: {e}")
+
+    downloaded = 0
+    uploaded = 0
+
+    # Download images in parallel, queueing each S3 upload on the same pool as soon as
+    # its download finishes so transfers overlap instead of running one after another
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = {
+            executor.submit(_fetch_image, client, image_url, local_file): (filename, local_file)
+            for filename, image_url, local_file in downloads
+        }
+        uploads = {}
 
-            with local_file.open("wb") as f:
-                f.write(response.content)
+        for future in as_completed(futures):
+            filename, local_file = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                console.print(f"❌ Error downloading {filename}: {e}")
+                continue
 
             downloaded += 1
             console.print(f"✅ Downloaded {filename}")
 
             # Upload to S3 if requested
-            if not local_only and bucket and HAS_BOTO3:
+            if s3_client is not None:
                 s3_key = f"nasa-epic/{collection}/{date_path}/{filename}"
-                try:
-                    s3_client = boto3.client("s3")
-                    s3_client.upload_file(str(local_file), bucket, s3_key)
-                    uploaded += 1
-                    console.print(f"📤 Uploaded to s3://{bucket}/{s3_key}")
-                except Exception as e:
-                    console.print(f"❌ S3 upload failed: {e}")
+                upload = executor.submit(
+                    s3_client.upload_file,
+                    str(local_file),
+                    bucket,
+                    s3_key,
+                    Config=_get_s3_transfer_config(),
+                )
+                uploads[upload] = s3_key
             elif not local_only and not HAS_BOTO3:
                 console.print("❌ boto3 not available for S3 upload")
 
-        except Exception as e:
-            console.print(f"❌ Error downloading {filename}: {e}")
-            continue
+        for future in as_completed(uploads):
+            s3_key = uploads[future]
+            try:
+                future.result()
+            except Exception as e:
+                console.print(f"❌ S3 upload failed: {e}")
+                continue
+
+            uploaded += 1
+            console.print(f"📤 Uploaded to s3://{bucket}/{s3_key}")
 
     # Summary
     console.print(f"\n✅ Downloaded {downloaded} images to {local_dir}")
@@ -281,7 +503,15 @@ def download_images(
 
 
 @main.command("metadata")
-@click.option("--date", help="Date (YYYY-MM-DD), defaults to yesterday")
+@click.option("--date", callback=_validate_date, help="Date (YYYY-MM-DD), defaults to yesterday")
+@click.option("--start-date", callback=_validate_date, help="First date of a range (YYYY-MM-DD)")
+@click.option("--end-date", callback=_validate_date, help="Last date of a range (YYYY-MM-DD)")
+@click.option(
+    "--days-back",
+    type=click.IntRange(min=0),
+    help="End the range this many days before today",
+)
+@click.option("--date-range-days", type=click.IntRange(min=1), help="Number of days in the range")
 @click.option(
     "--collection",
     type=click.Choice(["natural", "enhanced", "aerosol", "cloud"]),
@@ -296,54 +526,98 @@ def download_images(
     help="Output format",
 )
 @click.option("--output-file", type=click.Path(), help="Save to file")
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1, max=EpicApiClient.POOL_MAXSIZE),
+    default=DEFAULT_CONCURRENCY,
+    show_default=True,
+    help="Number of dates to fetch in parallel, up to the HTTP connection pool size",
+)
+@click.option("--no-cache", is_flag=True, help="Always query the API, bypassing the local cache")
+@click.option(
+    "--parallel",
+    is_flag=True,
+    help="Fetch and parse dates in worker processes, for long date ranges",
+)
 def get_metadata(
     date: str | None,
+    start_date: str | None,
+    end_date: str | None,
+    days_back: int | None,
+    date_range_days: int | None,
     collection: str,
     output_format: str,
     output_file: str | None,
+    concurrency: int,
+    no_cache: bool,
+    parallel: bool,
 ) -> None:
     """Get metadata for NASA EPIC images."""
-    date_str = date or (datetime.now(tz=timezone.utc) - timedelta(days=1)).strftime("%Y-%m-%d")
+    explicit_range = start_date is not None or end_date is not None
+    relative_range = days_back is not None or date_range_days is not None
+    if date is not None and (explicit_range or relative_range):
+        msg = "--date cannot be combined with other date range options"
+        raise click.UsageError(msg)
+    if explicit_range and relative_range:
+        msg = "--start-date/--end-date cannot be combined with --days-back/--date-range-days"
+        raise click.UsageError(msg)
+    if explicit_range and (start_date is None or end_date is None):
+        msg = "--start-date and --end-date must be given together"
+        raise click.UsageError(msg)
+
+    if date:
+        range_start, range_end = date, date
+    else:
+        range_start, range_end = get_date_range(start_date, end_date, days_back, date_range_days)
 
-    service = EpicApiService()
+    dates = _expand_date_range(range_start, range_end)
+    if not dates:
+        console.print(f"[red]Error: start date {range_start} is after end date {range_end}[/red]")
+        raise click.Abort()
 
-    # Get images using service for typed access
-    service_methods = {
-        "natural": service.get_natural_by_date_typed,
-        "enhanced": service.get_enhanced_by_date_typed,
-        "aerosol": service.get_aerosol_by_date_typed,
-        "cloud": service.get_cloud_by_date_typed,
-    }
+    date_str = range_start if range_start == range_end else f"{range_start} to {range_end}"
+
+    cache_dir = None if no_cache else _default_cache_dir()
+
+    # Fetch every date in parallel; map() keeps the results in date order
+    if parallel:
+        # Separate processes let validation of long ranges use more than one core; more
+        # processes than cores would only add interpreter start-up cost
+        with ProcessPoolExecutor(
+            max_workers=min(concurrency, os.cpu_count() or 1),
+            initializer=_init_metadata_worker,
+            initargs=(cache_dir,),
+        ) as process_executor:
+            rows_by_date = list(
+                process_executor.map(partial(_fetch_metadata_for_date, collection), dates)
+            )
+    else:
+        service = EpicApiService(cache_dir=cache_dir)
+        get_by_date = _by_date_method(service, collection)
 
-    response = service_methods[collection](date_str)
-    images = response.root  # type: ignore
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            responses = list(executor.map(get_by_date, dates))
 
-    if not images:
+        rows_by_date = [
+            _image_metadata(collection, image_date, response)
+            for image_date, response in zip(dates, responses, strict=True)
+        ]
+
+    metadata = [row for rows in rows_by_date for row in rows]
+
+    if not metadata:
         console.print(f"No {collection} images found for {date_str}")
         return
 
-    # Build metadata
-    metadata = []
-    for image in images:
-        data = {
-            "date": date_str,
-            "collection": collection,
-            "image_name": image.image,
-            "caption": image.caption,
-            "centroid_lat": image.centroid_coordinates.lat,
-            "centroid_lon": image.centroid_coordinates.lon,
-            "version": image.version,
-        }
-        metadata.append(data)
+    result = {
+        "metadata": metadata,
+        "total_images": len(metadata),
+        "date": date_str,
+        "collection": collection,
+    }
 
     # Output results
     if output_format == "json":
-        result = {
-            "metadata": metadata,
-            "total_images": len(metadata),
-            "date": date_str,
-            "collection": collection,
-        }
         output_json = json.dumps(result, indent=2)
 
         if output_file:
@@ -354,29 +628,23 @@ def get_metadata(
     else:
         # Table output
         table = Table(title=f"EPIC {collection.title()} Images - {date_str}")
-        table.add_column("Image", style="green")
+        table.add_column("Image", style="green", no_wrap=True)
         table.add_column("Caption", style="yellow")
-        table.add_column("Lat/Lon", style="blue")
-        table.add_column("Version", style="magenta")
+        table.add_column("Lat/Lon", style="blue", no_wrap=True)
+        table.add_column("Version", style="magenta", no_wrap=True)
 
+        # API strings are added as Text so square brackets are not parsed as Rich markup
         for item in metadata:
-            caption = item["caption"][:40] + "..." if len(item["caption"]) > 40 else item["caption"]
             table.add_row(
-                item["image_name"],
-                caption,
+                Text(item["image_name"]),
+                Text(_shorten_caption(item["caption"])),
                 f"{item['centroid_lat']:.2f}, {item['centroid_lon']:.2f}",
-                item["version"],
+                Text(item["version"]),
             )
 
         console.print(table)
 
         if output_file:
-            result = {
-                "metadata": metadata,
-                "total_images": len(metadata),
-                "date": date_str,
-                "collection": collection,
-            }
             Path(output_file).write_text(json.dumps(result, indent=2))
             console.print(f"Metadata also saved to {output_file}")
 
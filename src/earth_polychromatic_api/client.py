@@ -7,6 +7,7 @@ Imaging Camera (EPIC) API to retrieve Earth imagery and metadata.
 from typing import Any, cast
 
 import requests
+from requests.adapters import HTTPAdapter
 
 
 class EpicApiClient:
@@ -19,13 +20,45 @@ class EpicApiClient:
     BASE_URL = "https://epic.gsfc.nasa.gov/api"
     ARCHIVE_BASE_URL = "https://epic.gsfc.nasa.gov/archive"
 
+    # Keep-alive connections retained per host. Also the cap on concurrent requests (CLI
+    # --concurrency, EpicApiService.get_many) so parallel requests never overflow the pool.
+    POOL_MAXSIZE = 32
+
     def __init__(self, session: requests.Session | None = None):
         """Initialize the EPIC API client.
 
         Args:
             session: Optional requests session for custom configuration
         """
-        self.session = session or requests.Session()
+        self.session = session or self._create_session()
+
+    @classmethod
+    def _create_session(cls) -> requests.Session:
+        """Create a session whose connection pool is large enough for parallel requests.
+
+        Returns:
+            Session with an HTTPS adapter that reuses up to POOL_MAXSIZE connections
+        """
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_maxsize=cls.POOL_MAXSIZE))
+        return session
+
+    def get_json_bytes(self, path: str) -> bytes:
+        """Retrieve the undecoded JSON body of an API endpoint.
+
+        Lets callers hand the bytes straight to a JSON-aware parser such as Pydantic's
+        model_validate_json instead of building intermediate Python objects first.
+
+        Args:
+            path: Endpoint path relative to BASE_URL, e.g. "natural/date/2024-01-01"
+
+        Returns:
+            Raw JSON response body
+        """
+        url = f"{self.BASE_URL}/{path}"
+        response = self.session.get(url)
+        response.raise_for_status()
+        return response.content
 
     def get_natural_recent(self) -> list[dict[str, Any]]:
         """Retrieve metadata for the most recent natural color imagery.
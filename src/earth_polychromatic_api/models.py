@@ -10,6 +10,15 @@ from datetime import datetime
 from pydantic import BaseModel, ConfigDict, Field, RootModel, field_validator, model_validator
 from typing_extensions import Self
 
+# Validation patterns, compiled once since validators run for every image in a response
+_IDENTIFIER_PATTERN = re.compile(r"^\d{14}$")  # YYYYMMDDHHMISS
+_NATURAL_IMAGE_PATTERN = re.compile(r"^epic_1b_\d{14}$")
+_ENHANCED_IMAGE_PATTERN = re.compile(r"^epic_RGB_\d{14}$")
+_AEROSOL_IMAGE_PATTERN = re.compile(r"^epic_uvai_\d{14}$")
+_CLOUD_IMAGE_PATTERN = re.compile(r"^epic_cloudfraction_\d{14}$")
+# Any of the collection naming conventions above, matched in a single pass
+_IMAGE_NAME_PATTERN = re.compile(r"^epic_(?:1b|RGB|uvai|cloudfraction)_\d{14}$")
+
 
 class Coordinates2D(BaseModel):
     """Geographical coordinates model with latitude and longitude validation."""
@@ -106,7 +115,7 @@ class EpicImageMetadata(BaseModel):
     @classmethod
     def validate_identifier_format(cls, v: str) -> str:
         """Validate identifier follows YYYYMMDDHHMISS format."""
-        if not re.match(r"^\d{14}$", v):
+        if not _IDENTIFIER_PATTERN.match(v):
             msg = "Identifier must be 14 digits in YYYYMMDDHHMISS format"
             raise ValueError(msg)
         return v
@@ -115,14 +124,7 @@ class EpicImageMetadata(BaseModel):
     @classmethod
     def validate_image_name_format(cls, v: str) -> str:
         """Validate image name follows EPIC naming conventions."""
-        valid_patterns = [
-            r"^epic_1b_\d{14}$",  # Natural color: epic_1b_YYYYMMDDHHMISS
-            r"^epic_RGB_\d{14}$",  # Enhanced color: epic_RGB_YYYYMMDDHHMISS
-            r"^epic_uvai_\d{14}$",  # Aerosol index: epic_uvai_YYYYMMDDHHMISS
-            r"^epic_cloudfraction_\d{14}$",  # Cloud fraction: epic_cloudfraction_YYYYMMDDHHMISS
-        ]
-
-        if not any(re.match(pattern, v) for pattern in valid_patterns):
+        if not _IMAGE_NAME_PATTERN.match(v):
             msg = f"Image name '{v}' does not match any valid EPIC naming convention"
             raise ValueError(msg)
 
@@ -202,7 +204,7 @@ class NaturalImageMetadata(EpicImageMetadata):
     @classmethod
     def validate_natural_image_name(cls, v: str) -> str:
         """Validate natural color image naming convention."""
-        if not re.match(r"^epic_1b_\d{14}$", v):
+        if not _NATURAL_IMAGE_PATTERN.match(v):
             msg = f"Natural color image name must match pattern 'epic_1b_YYYYMMDDHHMISS', got '{v}'"
             raise ValueError(msg)
         return v
@@ -215,7 +217,7 @@ class EnhancedImageMetadata(EpicImageMetadata):
     @classmethod
     def validate_enhanced_image_name(cls, v: str) -> str:
         """Validate enhanced color image naming convention."""
-        if not re.match(r"^epic_RGB_\d{14}$", v):
+        if not _ENHANCED_IMAGE_PATTERN.match(v):
             msg = (
                 f"Enhanced color image name must match pattern 'epic_RGB_YYYYMMDDHHMISS', got '{v}'"
             )
@@ -230,7 +232,7 @@ class AerosolImageMetadata(EpicImageMetadata):
     @classmethod
     def validate_aerosol_image_name(cls, v: str) -> str:
         """Validate aerosol index image naming convention."""
-        if not re.match(r"^epic_uvai_\d{14}$", v):
+        if not _AEROSOL_IMAGE_PATTERN.match(v):
             msg = (
                 f"Aerosol index image name must match pattern 'epic_uvai_YYYYMMDDHHMISS', got '{v}'"
             )
@@ -245,7 +247,7 @@ class CloudImageMetadata(EpicImageMetadata):
     @classmethod
     def validate_cloud_image_name(cls, v: str) -> str:
         """Validate cloud fraction image naming convention."""
-        if not re.match(r"^epic_cloudfraction_\d{14}$", v):
+        if not _CLOUD_IMAGE_PATTERN.match(v):
             msg = (
                 f"Cloud fraction image name must match pattern "
                 f"'epic_cloudfraction_YYYYMMDDHHMISS', got '{v}'"
@@ -4,7 +4,15 @@ This module provides a high-level service for interacting with NASA's EPIC API
 that returns validated Pydantic models.
 """
 
+import tempfile
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import TypeVar
+
 import requests
+from pydantic import BaseModel, ValidationError
 
 from .client import EpicApiClient
 from .models import (
@@ -15,6 +23,12 @@ from .models import (
     NaturalImagesResponse,
 )
 
+ImagesResponse = (
+    NaturalImagesResponse | EnhancedImagesResponse | AerosolImagesResponse | CloudImagesResponse
+)
+
+ResponseT = TypeVar("ResponseT", bound=BaseModel)
+
 
 class EpicApiService:
     """High-level service for NASA EPIC API with Pydantic model validation.
@@ -23,13 +37,139 @@ class EpicApiService:
     validated Pydantic models with proper data transformation and validation.
     """
 
-    def __init__(self, session: requests.Session | None = None):
+    # Imagery older than this many days is considered final and may be cached
+    CACHE_SETTLE_DAYS = 3
+
+    # Cache layout version; bump when the response models change so old entries are ignored
+    CACHE_VERSION = "v1"
+
+    # Requests made in parallel by get_many unless told otherwise
+    DEFAULT_MAX_WORKERS = 8
+
+    # Response model for each collection's by-date endpoint
+    RESPONSE_MODELS: dict[str, type[ImagesResponse]] = {
+        "natural": NaturalImagesResponse,
+        "enhanced": EnhancedImagesResponse,
+        "aerosol": AerosolImagesResponse,
+        "cloud": CloudImagesResponse,
+    }
+
+    def __init__(self, session: requests.Session | None = None, cache_dir: Path | None = None):
         """Initialize the EPIC API service.
 
         Args:
             session: Optional requests session for custom configuration
+            cache_dir: Optional directory for caching by-date responses on disk
         """
         self.client = EpicApiClient(session=session)
+        self.cache_dir = cache_dir
+
+    def _cache_file(self, collection: str, date: str) -> Path | None:
+        """Return the cache file for a collection and date, or None if it must not be cached.
+
+        Archive data for a date stops changing once processing has caught up, so only
+        dates at least CACHE_SETTLE_DAYS in the past are cached.
+        """
+        if self.cache_dir is None:
+            return None
+
+        try:
+            date_dt = datetime.strptime(date, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+        except ValueError:
+            return None
+
+        if datetime.now(tz=timezone.utc) - date_dt < timedelta(days=self.CACHE_SETTLE_DAYS):
+            return None
+
+        return self.cache_dir / self.CACHE_VERSION / collection / f"{date}.json"
+
+    def _get_by_date(self, model: type[ResponseT], collection: str, date: str) -> ResponseT:
+        """Retrieve and validate a by-date response, serving settled dates from the disk cache.
+
+        Responses are only cached once they have validated, so an error body returned with
+        HTTP 200 is never stored. A cached copy that cannot be read or no longer validates
+        is treated as a miss, then refetched and overwritten.
+
+        Args:
+            model: Response model to validate the JSON body against
+            collection: Image collection type (natural, enhanced, aerosol, cloud)
+            date: Date string in YYYY-MM-DD format
+
+        Returns:
+            Validated response model
+        """
+        cache_file = self._cache_file(collection, date)
+        if cache_file is not None and cache_file.exists():
+            try:
+                return model.model_validate_json(cache_file.read_bytes())
+            except (OSError, ValidationError):
+                pass
+
+        content = self.client.get_json_bytes(f"{collection}/date/{date}")
+        response = model.model_validate_json(content)
+
+        # Empty responses are not cached in case the archive is still being filled in
+        if cache_file is not None and content.strip() != b"[]":
+            self._write_cache(cache_file, content)
+
+        return response
+
+    @staticmethod
+    def _write_cache(cache_file: Path, content: bytes) -> None:
+        """Atomically store a response body in the cache, ignoring filesystem errors.
+
+        The cache is an optimization, so an unwritable cache directory must not fail a
+        request that already succeeded. Each writer gets its own temporary file, so
+        concurrent writes of the same key never interleave.
+        """
+        temp_path: Path | None = None
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                dir=cache_file.parent, suffix=".tmp", delete=False
+            ) as temp_file:
+                temp_path = Path(temp_file.name)
+                temp_file.write(content)
+            temp_path.replace(cache_file)
+        except OSError:
+            if temp_path is not None:
+                temp_path.unlink(missing_ok=True)
+
+    def get_many(
+        self, keys: Iterable[tuple[str, str]], max_workers: int = DEFAULT_MAX_WORKERS
+    ) -> dict[tuple[str, str], ImagesResponse]:
+        """Retrieve by-date metadata for several collections and dates at once.
+
+        Repeated (collection, date) keys are fetched only once, and the distinct keys
+        are requested concurrently over the client's shared connection pool.
+
+        Args:
+            keys: (collection, date) pairs, e.g. [("natural", "2024-10-01")]
+            max_workers: Maximum number of requests in flight at the same time, capped at
+                EpicApiClient.POOL_MAXSIZE so every request gets a pooled connection
+
+        Returns:
+            Typed response for each distinct key, in the order first requested
+
+        Raises:
+            ValueError: If a key names an unknown collection
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        for collection, _ in unique_keys:
+            if collection not in self.RESPONSE_MODELS:
+                msg = f"Unknown collection: {collection}"
+                raise ValueError(msg)
+
+        def fetch(key: tuple[str, str]) -> ImagesResponse:
+            collection, date = key
+            return self._get_by_date(self.RESPONSE_MODELS[collection], collection, date)
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, EpicApiClient.POOL_MAXSIZE)
+        ) as executor:
+            responses = list(executor.map(fetch, unique_keys))
+
+        return dict(zip(unique_keys, responses, strict=True))
 
     def get_natural_recent_typed(self) -> NaturalImagesResponse:
         """Retrieve metadata for the most recent natural color imagery as typed models.
@@ -37,8 +177,8 @@ class EpicApiService:
         Returns:
             NaturalImagesResponse with validated metadata models
         """
-        data = self.client.get_natural_recent()
-        return NaturalImagesResponse.model_validate(data)
+        content = self.client.get_json_bytes("natural")
+        return NaturalImagesResponse.model_validate_json(content)
 
     def get_natural_by_date_typed(self, date: str) -> NaturalImagesResponse:
         """Retrieve metadata for natural color imagery for a specific date as typed models.
@@ -49,8 +189,7 @@ class EpicApiService:
         Returns:
             NaturalImagesResponse with validated metadata models
         """
-        data = self.client.get_natural_by_date(date)
-        return NaturalImagesResponse.model_validate(data)
+        return self._get_by_date(NaturalImagesResponse, "natural", date)
 
     def get_natural_all_dates_typed(self) -> AvailableDatesResponse:
         """Retrieve all available dates for natural color imagery as typed models.
@@ -58,8 +197,8 @@ class EpicApiService:
         Returns:
             AvailableDatesResponse with validated date models
         """
-        data = self.client.get_natural_all_dates()
-        return AvailableDatesResponse.model_validate(data)
+        content = self.client.get_json_bytes("natural/all")
+        return AvailableDatesResponse.model_validate_json(content)
 
     def get_enhanced_recent_typed(self) -> EnhancedImagesResponse:
         """Retrieve metadata for the most recent enhanced color imagery as typed models.
@@ -67,8 +206,8 @@ class EpicApiService:
         Returns:
             EnhancedImagesResponse with validated metadata models
         """
-        data = self.client.get_enhanced_recent()
-        return EnhancedImagesResponse.model_validate(data)
+        content = self.client.get_json_bytes("enhanced")
+        return EnhancedImagesResponse.model_validate_json(content)
 
     def get_enhanced_by_date_typed(self, date: str) -> EnhancedImagesResponse:
         """Retrieve metadata for enhanced color imagery for a specific date as typed models.
@@ -79,8 +218,7 @@ class EpicApiService:
         Returns:
             EnhancedImagesResponse with validated metadata models
         """
-        data = self.client.get_enhanced_by_date(date)
-        return EnhancedImagesResponse.model_validate(data)
+        return self._get_by_date(EnhancedImagesResponse, "enhanced", date)
 
     def get_enhanced_all_dates_typed(self) -> AvailableDatesResponse:
         """Retrieve all available dates for enhanced color imagery as typed models.
@@ -88,8 +226,8 @@ class EpicApiService:
         Returns:
             AvailableDatesResponse with validated date models
         """
-        data = self.client.get_enhanced_all_dates()
-        return AvailableDatesResponse.model_validate(data)
+        content = self.client.get_json_bytes("enhanced/all")
+        return AvailableDatesResponse.model_validate_json(content)
 
     def get_aerosol_recent_typed(self) -> AerosolImagesResponse:
         """Retrieve metadata for the most recent aerosol index imagery as typed models.
@@ -97,8 +235,8 @@ class EpicApiService:
         Returns:
             AerosolImagesResponse with validated metadata models
         """
-        data = self.client.get_aerosol_recent()
-        return AerosolImagesResponse.model_validate(data)
+        content = self.client.get_json_bytes("aerosol")
+        return AerosolImagesResponse.model_validate_json(content)
 
     def get_aerosol_by_date_typed(self, date: str) -> AerosolImagesResponse:
         """Retrieve metadata for aerosol index imagery for a specific date as typed models.
@@ -109,8 +247,7 @@ class EpicApiService:
         Returns:
             AerosolImagesResponse with validated metadata models
         """
-        data = self.client.get_aerosol_by_date(date)
-        return AerosolImagesResponse.model_validate(data)
+        return self._get_by_date(AerosolImagesResponse, "aerosol", date)
 
     def get_aerosol_all_dates_typed(self) -> AvailableDatesResponse:
         """Retrieve all available dates for aerosol index imagery as typed models.
@@ -118,8 +255,8 @@ class EpicApiService:
         Returns:
             AvailableDatesResponse with validated date models
         """
-        data = self.client.get_aerosol_all_dates()
-        return AvailableDatesResponse.model_validate(data)
+        content = self.client.get_json_bytes("aerosol/all")
+        return AvailableDatesResponse.model_validate_json(content)
 
     def get_cloud_recent_typed(self) -> CloudImagesResponse:
         """Retrieve metadata for the most recent cloud fraction imagery as typed models.
@@ -127,8 +264,8 @@ class EpicApiService:
         Returns:
             CloudImagesResponse with validated metadata models
         """
-        data = self.client.get_cloud_recent()
-        return CloudImagesResponse.model_validate(data)
+        content = self.client.get_json_bytes("cloud")
+        return CloudImagesResponse.model_validate_json(content)
 
     def get_cloud_by_date_typed(self, date: str) -> CloudImagesResponse:
         """Retrieve metadata for cloud fraction imagery for a specific date as typed models.
@@ -139,8 +276,7 @@ class EpicApiService:
         Returns:
             CloudImagesResponse with validated metadata models
         """
-        data = self.client.get_cloud_by_date(date)
-        return CloudImagesResponse.model_validate(data)
+        return self._get_by_date(CloudImagesResponse, "cloud", date)
 
     def get_cloud_all_dates_typed(self) -> AvailableDatesResponse:
         """Retrieve all available dates for cloud fraction imagery as typed models.
@@ -148,5 +284,5 @@ class EpicApiService:
         Returns:
             AvailableDatesResponse with validated date models
         """
-        data = self.client.get_cloud_all_dates()
-        return AvailableDatesResponse.model_validate(data)
+        content = self.client.get_json_bytes("cloud/all")
+        return AvailableDatesResponse.model_validate_json(content)
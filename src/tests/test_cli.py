@@ -4,22 +4,49 @@ Tests CLI commands, functions, and integration using pytest with mocked dependen
 """
 
 import json
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from unittest.mock import Mock, patch
+from io import BytesIO
+from pathlib import Path
+from unittest.mock import ANY, Mock, patch
 
 import pytest
 from click.testing import CliRunner
 
+from earth_polychromatic_api import cli
 from earth_polychromatic_api.cli import (
+    S3_MAX_POOL_CONNECTIONS,
+    TABLE_CAPTION_WIDTH,
+    _by_date_method,
+    _default_cache_dir,
+    _expand_date_range,
+    _fetch_image,
+    _fetch_metadata_for_date,
+    _get_s3_client,
+    _image_filename,
+    _shorten_caption,
     download_images,
     get_date_range,
     get_metadata,
     main,
 )
+from earth_polychromatic_api.client import EpicApiClient
 
 # Test constants
+TEST_DATA_DIR = Path(__file__).parent / "test_datasets"
 EXPECTED_LAT = 0.74
 EXPECTED_LON = 174.65
+FIXED_NOW = datetime(2024, 10, 15, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture(autouse=True)
+def reset_s3_client():
+    """Fixture discarding the process-wide S3 client so each test sees its own mock."""
+    _get_s3_client.cache_clear()
+    yield
+    _get_s3_client.cache_clear()
 
 
 @pytest.fixture
@@ -70,7 +97,7 @@ def mock_service():
 def mock_download_response():
     """Fixture providing a mocked successful HTTP response for image download."""
     response = Mock()
-    response.content = b"fake_image_data"
+    response.raw = BytesIO(b"fake_image_data")
     response.raise_for_status.return_value = None
     return response
 
@@ -101,15 +128,13 @@ class TestGetDateRange:
         """
         # Arrange
         days_back = 5
-        expected_end = datetime.now(tz=timezone.utc) - timedelta(days=5)
-        expected_date_str = expected_end.strftime("%Y-%m-%d")
 
         # Act
-        result_start, result_end = get_date_range(None, None, days_back, None)
+        result_start, result_end = get_date_range(None, None, days_back, None, now=FIXED_NOW)
 
         # Assert
-        assert result_start == expected_date_str
-        assert result_end == expected_date_str
+        assert result_start == "2024-10-10"
+        assert result_end == "2024-10-10"
 
     def test_relative_dates_with_range(self):
         """Test date range calculation with both days_back and date_range_days.
@@ -119,31 +144,141 @@ class TestGetDateRange:
         # Arrange
         days_back = 3
         date_range_days = 7
-        expected_end = datetime.now(tz=timezone.utc) - timedelta(days=3)
-        expected_start = expected_end - timedelta(days=6)  # range-1
 
         # Act
-        result_start, result_end = get_date_range(None, None, days_back, date_range_days)
+        result_start, result_end = get_date_range(
+            None, None, days_back, date_range_days, now=FIXED_NOW
+        )
 
         # Assert
-        assert result_start == expected_start.strftime("%Y-%m-%d")
-        assert result_end == expected_end.strftime("%Y-%m-%d")
+        assert result_start == "2024-10-06"  # range-1 days before the end
+        assert result_end == "2024-10-12"
+
+    def test_zero_days_back_ends_today(self):
+        """Test a range zero days back ends today instead of being bumped to yesterday."""
+        # Act
+        result_start, result_end = get_date_range(None, None, 0, 2, now=FIXED_NOW)
+
+        # Assert
+        assert result_start == "2024-10-14"
+        assert result_end == "2024-10-15"
 
     def test_default_yesterday(self):
         """Test default behavior when no parameters provided.
 
         Should return yesterday's date for both start and end.
         """
+        # Act
+        result_start, result_end = get_date_range(None, None, None, None, now=FIXED_NOW)
+
+        # Assert
+        assert result_start == "2024-10-14"
+        assert result_end == "2024-10-14"
+
+    def test_expand_range_across_month_end(self):
+        """Test expanding a range lists every day inclusively across a month boundary."""
+        # Act
+        result = _expand_date_range("2024-09-29", "2024-10-02")
+
+        # Assert
+        assert result == ["2024-09-29", "2024-09-30", "2024-10-01", "2024-10-02"]
+
+    def test_expand_range_accepts_unpadded_dates(self):
+        """Test single-digit months and days are accepted and normalized."""
+        # Act
+        result = _expand_date_range("2024-9-30", "2024-10-1")
+
+        # Assert
+        assert result == ["2024-09-30", "2024-10-01"]
+
+    @pytest.mark.parametrize("value", ["20241001", "2024-W40-2", "2024/10/01"])
+    def test_expand_range_rejects_other_formats(self, value):
+        """Test only YYYY-MM-DD dates are accepted, whatever the Python version."""
+        # Act & Assert
+        with pytest.raises(ValueError):
+            _expand_date_range(value, value)
+
+
+class TestImageFilename:
+    """Test local filename derivation for downloaded images."""
+
+    @pytest.mark.parametrize(
+        ("collection", "image_name", "expected"),
+        [
+            ("natural", "epic_1b_20241001003633", "epic_1b_20241001003633.png"),
+            ("enhanced", "epic_RGB_20241001003633", "epic_RGB_20241001003633.png"),
+            ("cloud", "epic_cloudfraction_20241001003633", "epic_cloudfraction_20241001003633.png"),
+            ("aerosol", "epic_uvai_20241001003633", "epic_aerosol_20241001003633.png"),
+        ],
+    )
+    def test_filename_per_collection(self, collection, image_name, expected):
+        """Test each collection maps to its expected local filename.
+
+        Cloud and aerosol names keep only the timestamp behind their own prefix.
+        """
+        # Act
+        result = _image_filename(collection, image_name)
+
+        # Assert
+        assert result == expected
+
+
+class TestDefaultCacheDir:
+    """Test resolution of the metadata cache directory."""
+
+    def test_absolute_xdg_cache_home(self, monkeypatch, tmp_path):
+        """Test an absolute XDG_CACHE_HOME is used as the cache base directory."""
         # Arrange
-        expected_date = datetime.now(tz=timezone.utc) - timedelta(days=1)
-        expected_date_str = expected_date.strftime("%Y-%m-%d")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+        # Act & Assert
+        assert _default_cache_dir() == tmp_path / "earth_polychromatic_api"
+
+    def test_relative_xdg_cache_home_ignored(self, monkeypatch, tmp_path):
+        """Test a relative XDG_CACHE_HOME falls back to ~/.cache as the XDG spec requires."""
+        # Arrange
+        monkeypatch.setenv("XDG_CACHE_HOME", "relative/cache")
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+
+        # Act & Assert
+        assert _default_cache_dir() == tmp_path / ".cache" / "earth_polychromatic_api"
+
+    def test_unknown_home_disables_cache(self, monkeypatch):
+        """Test the cache is disabled when no home directory can be determined."""
+
+        # Arrange - no XDG_CACHE_HOME and a home directory lookup that fails
+        def no_home():
+            raise RuntimeError("Could not determine home directory.")
+
+        monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+        monkeypatch.setattr(Path, "home", no_home)
+
+        # Act & Assert
+        assert _default_cache_dir() is None
 
+
+class TestShortenCaption:
+    """Test caption shortening for metadata tables."""
+
+    @pytest.mark.parametrize(
+        ("caption", "expected"),
+        [
+            ("Short caption", "Short caption"),
+            (
+                "This is a very long caption that should be truncated because it exceeds",
+                "This is a very long caption that...",
+            ),
+            ("x" * 50, "x" * 37 + "..."),
+        ],
+    )
+    def test_shorten_caption(self, caption, expected):
+        """Test captions are cut at a word boundary, or hard-cut when one word is too long."""
         # Act
-        result_start, result_end = get_date_range(None, None, None, None)
+        result = _shorten_caption(caption)
 
         # Assert
-        assert result_start == expected_date_str
-        assert result_end == expected_date_str
+        assert result == expected
+        assert len(result) <= TABLE_CAPTION_WIDTH
 
 
 class TestMainCommand:
@@ -194,7 +329,7 @@ class TestDownloadImagesCommand:
             {"image": "epic_1b_20241001003633", "date": "2024-10-01 00:36:33"}
         ]
         mock_download_response = Mock()
-        mock_download_response.content = b"fake_image_data"
+        mock_download_response.raw = BytesIO(b"fake_image_data")
         mock_download_response.raise_for_status.return_value = None
         mock_client.session.get.return_value = mock_download_response
         mock_client_class.return_value = mock_client
@@ -227,6 +362,93 @@ class TestDownloadImagesCommand:
         mock_client.get_natural_by_date.assert_called_once_with("2024-10-01")
         mock_s3_client.upload_file.assert_called_once()
 
+    @patch("earth_polychromatic_api.cli.EpicApiClient")
+    @patch("earth_polychromatic_api.cli.HAS_BOTO3", True)
+    @patch("earth_polychromatic_api.cli.boto3")
+    def test_parallel_s3_uploads_share_client(
+        self,
+        mock_boto3,
+        mock_client_class,
+        cli_runner,
+        mock_client,
+        mock_download_response,
+        tmp_path,
+    ):
+        """Test every downloaded image is uploaded through a single S3 client.
+
+        Should create the S3 client once and upload each image exactly once.
+        """
+        # Arrange
+        image_names = [f"epic_1b_2024100100363{i}" for i in range(3)]
+        mock_client_class.return_value = mock_client
+        mock_client.get_natural_by_date.return_value = [
+            {"image": name, "date": "2024-10-01 00:36:33"} for name in image_names
+        ]
+        mock_client.session.get.return_value = mock_download_response
+
+        mock_s3_client = Mock()
+        mock_boto3.client.return_value = mock_s3_client
+
+        # Act
+        result = cli_runner.invoke(
+            download_images,
+            [
+                "--date",
+                "2024-10-01",
+                "--collection",
+                "natural",
+                "--bucket",
+                "test-bucket",
+                "--local-dir",
+                str(tmp_path),
+            ],
+        )
+
+        # Assert
+        assert result.exit_code == 0
+        assert "📤 Uploaded 3 images to S3" in result.output
+        mock_boto3.client.assert_called_once_with("s3", config=ANY)
+        assert mock_s3_client.upload_file.call_count == len(image_names)
+        uploaded_keys = {call.args[2] for call in mock_s3_client.upload_file.call_args_list}
+        assert uploaded_keys == {f"nasa-epic/natural/2024/10/01/{name}.png" for name in image_names}
+        for call in mock_s3_client.upload_file.call_args_list:
+            assert call.kwargs["Config"].use_threads is False
+
+    @patch("earth_polychromatic_api.cli.boto3")
+    def test_s3_client_reused_across_calls(self, mock_boto3):
+        """Test the S3 client is created once per process and then reused.
+
+        Should configure a connection pool large enough for parallel uploads.
+        """
+        # Arrange & Act
+        first = _get_s3_client()
+        second = _get_s3_client()
+
+        # Assert
+        assert first is second
+        mock_boto3.client.assert_called_once_with("s3", config=ANY)
+        config = mock_boto3.client.call_args.kwargs["config"]
+        assert config.max_pool_connections == S3_MAX_POOL_CONNECTIONS
+
+    def test_boto3_imported_on_first_upload(self):
+        """Test importing the CLI leaves boto3 unimported until an upload needs it.
+
+        Should keep startup cheap for metadata queries and local-only downloads.
+        """
+        # Arrange
+        code = (
+            "import sys; import earth_polychromatic_api.cli as cli; "
+            "print('boto3' in sys.modules, cli.HAS_BOTO3)"
+        )
+
+        # Act
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        # Assert
+        assert result.stdout.split() == ["False", "True"]
+
     @patch("earth_polychromatic_api.cli.EpicApiClient")
     def test_image_download_local_only(
         self, mock_client_class, cli_runner, mock_client, mock_download_response, tmp_path
@@ -262,6 +484,34 @@ class TestDownloadImagesCommand:
         # Verify file was created
         expected_file = tmp_path / "natural" / "2024" / "10" / "01" / "epic_1b_20241001003633.png"
         assert expected_file.exists()
+        assert expected_file.read_bytes() == b"fake_image_data"
+        mock_client.session.get.assert_called_once_with(
+            mock_client.build_image_url.return_value, stream=True
+        )
+
+    def test_interrupted_download_leaves_no_file(self, mock_client, tmp_path):
+        """Test a connection dropped mid-body does not leave a truncated image.
+
+        Should remove the partial download and re-raise the error.
+        """
+
+        # Arrange - raw stream that fails after the first block
+        class ResetStream(BytesIO):
+            def read(self, size=-1):
+                if self.tell():
+                    raise ConnectionResetError("Connection reset by peer")
+                return super().read(4)
+
+        response = Mock()
+        response.raw = ResetStream(b"fake_image_data")
+        response.raise_for_status.return_value = None
+        mock_client.session.get.return_value = response
+        local_file = tmp_path / "epic_1b_20241001003633.png"
+
+        # Act & Assert
+        with pytest.raises(ConnectionResetError):
+            _fetch_image(mock_client, "https://example.com/image.png", local_file)
+        assert list(tmp_path.iterdir()) == []
 
     @patch("earth_polychromatic_api.cli.EpicApiClient")
     def test_no_images_found(self, mock_client_class, cli_runner, mock_client):
@@ -381,6 +631,59 @@ class TestDownloadImagesCommand:
         assert result.exit_code == 0
         assert "✅ Downloaded epic_aerosol_20241001003633.png" in result.output
 
+    def test_concurrency_capped_at_connection_pool_size(self, cli_runner):
+        """Test --concurrency cannot exceed the HTTP connection pool size.
+
+        Should reject values that would overflow the pool and discard connections.
+        """
+        # Act
+        result = cli_runner.invoke(
+            download_images, ["--local-only", "--concurrency", str(EpicApiClient.POOL_MAXSIZE + 1)]
+        )
+
+        # Assert
+        assert result.exit_code == 2
+        assert "Invalid value for '--concurrency'" in result.output
+
+    @patch("earth_polychromatic_api.cli.EpicApiClient")
+    def test_concurrent_download_multiple_images(
+        self, mock_client_class, cli_runner, mock_client, mock_download_response, tmp_path
+    ):
+        """Test multiple images are downloaded through the worker pool.
+
+        Every image should be fetched and written regardless of completion order.
+        """
+        # Arrange
+        image_names = [f"epic_1b_2024100100363{i}" for i in range(3)]
+        mock_client_class.return_value = mock_client
+        mock_client.get_natural_by_date.return_value = [
+            {"image": name, "date": "2024-10-01 00:36:33"} for name in image_names
+        ]
+        mock_client.session.get.return_value = mock_download_response
+
+        # Act
+        result = cli_runner.invoke(
+            download_images,
+            [
+                "--date",
+                "2024-10-01",
+                "--collection",
+                "natural",
+                "--local-only",
+                "--local-dir",
+                str(tmp_path),
+                "--concurrency",
+                "2",
+            ],
+        )
+
+        # Assert
+        assert result.exit_code == 0
+        assert "✅ Downloaded 3 images" in result.output
+        assert mock_client.session.get.call_count == len(image_names)
+        for name in image_names:
+            assert (tmp_path / "natural" / "2024" / "10" / "01" / f"{name}.png").exists()
+
 
 class TestGetMetadataCommand:
     """Test metadata retrieval CLI command functionality."""
@@ -474,6 +777,34 @@ class TestGetMetadataCommand:
         assert saved_data["total_images"] == 1
         assert saved_data["metadata"][0]["image_name"] == "epic_1b_20241001003633"
 
+    @patch("earth_polychromatic_api.cli.EpicApiService")
+    def test_table_output_also_saved_to_file(
+        self, mock_service_class, cli_runner, mock_service, tmp_path
+    ):
+        """Test table output with an output file.
+
+        Should render the table and save the same metadata as JSON.
+        """
+        # Arrange
+        mock_service_class.return_value = mock_service
+        output_file = tmp_path / "metadata.json"
+
+        # Act
+        result = cli_runner.invoke(
+            get_metadata,
+            ["--date", "2024-10-01", "--format", "table", "--output-file", str(output_file)],
+        )
+
+        # Assert
+        assert result.exit_code == 0
+        assert "EPIC Natural Images - 2024-10-01" in result.output
+        assert "Metadata also saved to" in result.output
+
+        saved_data = json.loads(output_file.read_text())
+        assert saved_data["total_images"] == 1
+        assert saved_data["date"] == "2024-10-01"
+        assert saved_data["metadata"][0]["centroid_lat"] == EXPECTED_LAT
+
     @patch("earth_polychromatic_api.cli.EpicApiService")
     def test_no_metadata_found(self, mock_service_class, cli_runner, mock_service):
         """Test handling when no metadata is found.
@@ -569,6 +900,238 @@ class TestGetMetadataCommand:
         assert result.exit_code == 0
         mock_service.get_natural_by_date_typed.assert_called_once_with(yesterday)
 
+    @patch("earth_polychromatic_api.cli.EpicApiService")
+    def test_date_range_metadata(self, mock_service_class, cli_runner, mock_service):
+        """Test metadata retrieval across a date range.
+
+        Should query every date in the range and merge results in date order.
+        """
+        # Arrange
+        mock_service_class.return_value = mock_service
+        expected_dates = ["2024-10-01", "2024-10-02", "2024-10-03"]
+
+        # Act
+        result = cli_runner.invoke(
+            get_metadata,
+            [
+                "--start-date",
+                "2024-10-01",
+                "--end-date",
+                "2024-10-03",
+                "--format",
+                "json",
+                "--concurrency",
+                "2",
+            ],
+        )
+
+        # Assert
+        assert result.exit_code == 0
+        output_data = json.loads(result.output)
+        assert output_data["total_images"] == len(expected_dates)
+        assert output_data["date"] == "2024-10-01 to 2024-10-03"
+        assert [item["date"] for item in output_data["metadata"]] == expected_dates
+
+        called_dates = [
+            call.args[0] for call in mock_service.get_natural_by_date_typed.call_args_list
+        ]
+        assert sorted(called_dates) == expected_dates
+
+    @patch("earth_polychromatic_api.cli.ProcessPoolExecutor", ThreadPoolExecutor)
+    @patch("earth_polychromatic_api.cli.EpicApiService")
+    def test_parallel_metadata_uses_worker_service(
+        self, mock_service_class, cli_runner, mock_service, monkeypatch
+    ):
+        """Test --parallel fetches each date through the per-worker service.
+
+        Should create the worker service with the cache directory and keep date order.
+        """
+        # Arrange - run workers in-process so the mocked service is visible to them
+        monkeypatch.setattr(cli, "_worker_service", None)
+        mock_service_class.return_value = mock_service
+        expected_dates = ["2024-10-01", "2024-10-02", "2024-10-03"]
+
+        # Act
+        result = cli_runner.invoke(
+            get_metadata,
+            [
+                "--start-date",
+                "2024-10-01",
+                "--end-date",
+                "2024-10-03",
+                "--format",
+                "json",
+                "--parallel",
+            ],
+        )
+
+        # Assert
+        assert result.exit_code == 0
+        output_data = json.loads(result.output)
+        assert [item["date"] for item in output_data["metadata"]] == expected_dates
+        assert output_data["metadata"][0]["centroid_lat"] == EXPECTED_LAT
+        mock_service_class.assert_called_with(cache_dir=_default_cache_dir())
+        assert mock_service.get_natural_by_date_typed.call_count == len(expected_dates)
+
+    @patch("earth_polychromatic_api.cli.EpicApiService")
+    def test_parallel_metadata_capped_at_cpu_count(
+        self, mock_service_class, cli_runner, mock_service, monkeypatch
+    ):
+        """Test --parallel starts no more worker processes than there are CPUs."""
+        # Arrange - two CPUs and an in-process stand-in for the process pool
+        monkeypatch.setattr(cli, "_worker_service", None)
+        monkeypatch.setattr(cli.os, "cpu_count", lambda: 2)
+        mock_service_class.return_value = mock_service
+
+        # Act
+        with patch(
+            "earth_polychromatic_api.cli.ProcessPoolExecutor", wraps=ThreadPoolExecutor
+        ) as mock_pool_class:
+            result = cli_runner.invoke(
+                get_metadata, ["--date", "2024-10-01", "--format", "json", "--parallel"]
+            )
+
+        # Assert - default concurrency of 8 is capped at 2 processes
+        assert result.exit_code == 0
+        assert mock_pool_class.call_args.kwargs["max_workers"] == 2
+
+    def test_unknown_collection_fails_alike_in_both_modes(self, mock_service, monkeypatch):
+        """Test threaded and worker-process lookups reject an unknown collection the same way."""
+        # Arrange
+        monkeypatch.setattr(cli, "_worker_service", mock_service)
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Unknown collection: invalid"):
+            _by_date_method(mock_service, "invalid")
+        with pytest.raises(ValueError, match="Unknown collection: invalid"):
+            _fetch_metadata_for_date("invalid", "2024-10-01")
+
+    def test_parallel_metadata_across_processes(self, cli_runner, tmp_path, monkeypatch):
+        """Test --parallel merges results parsed in real worker processes.
+
+        Should read settled dates from the cache directory without reaching the API.
+        """
+        # Arrange - seed the cache so workers need no network access
+        body = (TEST_DATA_DIR / "natural_recent_response.json").read_bytes()
+        expected_per_date = len(json.loads(body))
+        for day in ("2024-10-01", "2024-10-02"):
+            cache_file = tmp_path / cli.EpicApiService.CACHE_VERSION / "natural" / f"{day}.json"
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_bytes(body)
+        monkeypatch.setattr(cli, "_default_cache_dir", lambda: tmp_path)
+
+        # Act
+        result = cli_runner.invoke(
+            get_metadata,
+            [
+                "--start-date",
+                "2024-10-01",
+                "--end-date",
+                "2024-10-02",
+                "--format",
+                "json",
+                "--concurrency",
+                "2",
+                "--parallel",
+            ],
+        )
+
+        # Assert
+        assert result.exit_code == 0
+        output_data = json.loads(result.output)
+        assert output_data["total_images"] == 2 * expected_per_date
+        assert output_data["metadata"][0]["date"] == "2024-10-01"
+        assert output_data["metadata"][-1]["date"] == "2024-10-02"
+
+    @patch("earth_polychromatic_api.cli.EpicApiService")
+    def test_metadata_cache_enabled_by_default(self, mock_service_class, cli_runner, mock_service):
+        """Test metadata command enables the response cache unless disabled.
+
+        Should pass the default cache directory, or None with --no-cache.
+        """
+        # Arrange
+        mock_service_class.return_value = mock_service
+
+        # Act
+        cached = cli_runner.invoke(get_metadata, ["--date", "2024-10-01"])
+        uncached = cli_runner.invoke(get_metadata, ["--date", "2024-10-01", "--no-cache"])
+
+        # Assert
+        assert cached.exit_code == 0
+        assert uncached.exit_code == 0
+        assert mock_service_class.call_args_list[0].kwargs == {"cache_dir": _default_cache_dir()}
+        assert mock_service_class.call_args_list[1].kwargs == {"cache_dir": None}
+
+    @pytest.mark.parametrize("option", ["--date", "--start-date", "--end-date"])
+    def test_malformed_date_rejected(self, cli_runner, option):
+        """Test a date not in YYYY-MM-DD format is reported as a bad parameter.
+
+        Should exit with a usage error instead of a traceback.
+        """
+        # Act
+        result = cli_runner.invoke(get_metadata, [option, "2024/10/01"])
+
+        # Assert
+        assert result.exit_code == 2
+        assert "'2024/10/01' is not a valid date, expected YYYY-MM-DD" in result.output
+
+    @pytest.mark.parametrize(
+        ("args", "message"),
+        [
+            (
+                ["--date", "2024-10-01", "--start-date", "2024-10-01", "--end-date", "2024-10-02"],
+                "--date cannot be combined with other date range options",
+            ),
+            (
+                ["--date", "2024-10-01", "--days-back", "3"],
+                "--date cannot be combined with other date range options",
+            ),
+            (
+                ["--start-date", "2024-10-01", "--end-date", "2024-10-02", "--days-back", "3"],
+                "cannot be combined with --days-back/--date-range-days",
+            ),
+            (["--start-date", "2024-10-01"], "--start-date and --end-date must be given together"),
+            (["--end-date", "2024-10-01"], "--start-date and --end-date must be given together"),
+        ],
+    )
+    def test_conflicting_date_options_rejected(self, cli_runner, args, message):
+        """Test date options that would silently override each other are rejected.
+
+        Should exit with a usage error naming the conflict.
+        """
+        # Act
+        result = cli_runner.invoke(get_metadata, args)
+
+        # Assert
+        assert result.exit_code == 2
+        assert message in result.output
+
+    @pytest.mark.parametrize(
+        ("option", "value"), [("--days-back", "-1"), ("--date-range-days", "0")]
+    )
+    def test_out_of_range_relative_dates_rejected(self, cli_runner, option, value):
+        """Test negative days back and empty ranges are rejected instead of adjusted."""
+        # Act
+        result = cli_runner.invoke(get_metadata, [option, value])
+
+        # Assert
+        assert result.exit_code == 2
+        assert f"Invalid value for '{option}'" in result.output
+
+    def test_reversed_date_range(self, cli_runner):
+        """Test error when the start date is after the end date.
+
+        Should exit with error and display helpful message.
+        """
+        # Arrange & Act
+        result = cli_runner.invoke(
+            get_metadata, ["--start-date", "2024-10-03", "--end-date", "2024-10-01"]
+        )
+
+        # Assert
+        assert result.exit_code == 1
+        assert "is after end date" in result.output
+
 
 class TestCLIIntegration:
     """Test CLI integration scenarios and edge cases."""
@@ -647,3 +1210,32 @@ class TestCLIIntegration:
         # Check that the caption appears to be truncated (exact format may vary)
         assert "test_image" in result.output
         assert "This is a very long" in result.output
+
+    @patch("earth_polychromatic_api.cli.EpicApiService")
+    def test_caption_brackets_not_treated_as_markup(self, mock_service_class, cli_runner):
+        """Test captions are shown literally in table output.
+
+        Should keep square brackets that Rich would otherwise parse as markup.
+        """
+        # Arrange
+        mock_service = Mock()
+        mock_image = Mock()
+        mock_image.image = "test_image"
+        mock_image.caption = "Earth [bold]from[/bold] L1"
+        mock_image.centroid_coordinates.lat = 0.0
+        mock_image.centroid_coordinates.lon = 0.0
+        mock_image.version = "03"
+
+        mock_response = Mock()
+        mock_response.root = [mock_image]
+        mock_service.get_natural_by_date_typed.return_value = mock_response
+        mock_service_class.return_value = mock_service
+
+        # Act
+        result = cli_runner.invoke(
+            get_metadata, ["--date", "2024-10-01", "--collection", "natural", "--format", "table"]
+        )
+
+        # Assert
+        assert result.exit_code == 0
+        assert "Earth [bold]from[/bold] L1" in result.output
@@ -3,14 +3,19 @@
 Tests all endpoints using pytest with mocked responses and test data.
 """
 
+import importlib.util
 import json
+import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import Mock
 
 import pytest
 import requests
 
+import earth_polychromatic_api
 from earth_polychromatic_api.client import EpicApiClient
+from earth_polychromatic_api.models import NaturalImageMetadata
 
 # Test data paths
 TEST_DATA_DIR = Path(__file__).parent / "test_datasets"
@@ -393,6 +398,75 @@ class TestCloudEndpoints:
         assert "date" in result[0]  # Verify date structure exists
 
 
+class TestRawJsonEndpoint:
+    """Test retrieval of undecoded JSON response bodies."""
+
+    def test_get_json_bytes(self, client, mock_session, natural_recent_data, monkeypatch):
+        """Test retrieving the raw JSON body of an endpoint.
+
+        Verifies the path is resolved against the API base URL and the response
+        body is returned as bytes without being decoded.
+        """
+        # Arrange - setup mock response with raw JSON bytes
+        raw_body = json.dumps(natural_recent_data).encode()
+        mock_response = Mock()
+        mock_response.content = raw_body
+        mock_response.raise_for_status.return_value = None
+        mock_session.get.return_value = mock_response
+
+        # Act - request the raw body for a date endpoint
+        result = client.get_json_bytes("natural/date/2024-10-01")
+
+        # Assert - verify correct URL and untouched body
+        mock_session.get.assert_called_once_with(
+            "https://epic.gsfc.nasa.gov/api/natural/date/2024-10-01"
+        )
+        mock_response.raise_for_status.assert_called_once()
+        assert result == raw_body
+        mock_response.json.assert_not_called()
+
+
+class TestPackageExports:
+    """Test lazy resolution of the package's public names."""
+
+    def test_public_names_resolve_to_submodule_objects(self):
+        """Test public names are importable from the package root.
+
+        Verifies each lazily imported name is the object defined in its submodule.
+        """
+        # Act & Assert - verify every exported name resolves
+        for name in earth_polychromatic_api.__all__:
+            assert getattr(earth_polychromatic_api, name) is not None
+        assert earth_polychromatic_api.EpicApiClient is EpicApiClient
+        assert earth_polychromatic_api.NaturalImageMetadata is NaturalImageMetadata
+        assert set(earth_polychromatic_api.__all__) <= set(dir(earth_polychromatic_api))
+
+    def test_unknown_name_raises_attribute_error(self):
+        """Test accessing a name the package does not export fails normally."""
+        # Act & Assert
+        with pytest.raises(AttributeError, match="no attribute 'Missing'"):
+            _ = earth_polychromatic_api.Missing
+
+    def test_package_import_defers_submodules(self):
+        """Test importing the package does not load requests or pydantic.
+
+        Verifies submodules are only imported once one of their names is used.
+        """
+        # Arrange
+        code = (
+            "import sys; import earth_polychromatic_api; "
+            "print('requests' in sys.modules, 'pydantic' in sys.modules)"
+        )
+
+        # Act
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        # Assert
+        assert result.stdout.split() == ["False", "False"]
+
+
 class TestImageUrlBuilder:
     """Test image URL construction functionality."""
 
@@ -520,3 +594,35 @@ class TestErrorHandling:
 
         # Assert - verify custom session is used
         assert client.session is mock_session
+
+
+class TestSessionConfiguration:
+    """Test configuration of the default HTTP session."""
+
+    def test_session_connection_pool_size(self):
+        """Test default session keeps enough pooled connections for parallel downloads.
+
+        Verifies that the HTTPS adapter mounted on the default session retains
+        POOL_MAXSIZE keep-alive connections so concurrent requests reuse them.
+        """
+        # Arrange & Act - create client without session parameter
+        client = EpicApiClient()
+
+        # Assert - verify archive requests go through the enlarged pool
+        adapter = client.session.get_adapter(client.ARCHIVE_BASE_URL)
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == EpicApiClient.POOL_MAXSIZE
+
+    def test_session_accepts_compressed_responses(self):
+        """Test default session asks the API for compressed response bodies.
+
+        Validates gzip is always advertised and Brotli is added when the optional
+        brotli extra is installed, so metadata JSON crosses the wire compressed.
+        """
+        # Arrange & Act - create client without session parameter
+        client = EpicApiClient()
+
+        # Assert - verify the advertised content codings
+        accept_encoding = client.session.headers["Accept-Encoding"]
+        assert "gzip" in accept_encoding
+        has_brotli = any(importlib.util.find_spec(name) for name in ("brotli", "brotlicffi"))
+        assert ("br" in accept_encoding) == has_brotli
@@ -4,11 +4,16 @@ Tests the typed methods that return Pydantic models with validation.
 """
 
 import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import Mock
 
 import pytest
+from pydantic import ValidationError
 
+from earth_polychromatic_api import service as service_module
+from earth_polychromatic_api.client import EpicApiClient
 from earth_polychromatic_api.models import (
     AerosolImageMetadata,
     AerosolImagesResponse,
@@ -93,7 +98,7 @@ class TestNaturalTypedEndpoints:
         """Test retrieving most recent natural color imagery as typed models."""
         # Arrange - setup mock response with natural color test data
         mock_response = Mock()
-        mock_response.json.return_value = natural_recent_data
+        mock_response.content = json.dumps(natural_recent_data).encode()
         mock_response.raise_for_status.return_value = None
         mock_session.get.return_value = mock_response
 
@@ -117,7 +122,7 @@ class TestNaturalTypedEndpoints:
         # Arrange - setup date parameter and mock response
         test_date = "2025-07-15"
         mock_response = Mock()
-        mock_response.json.return_value = natural_recent_data
+        mock_response.content = json.dumps(natural_recent_data).encode()
         mock_response.raise_for_status.return_value = None
         mock_session.get.return_value = mock_response
 
@@ -125,6 +130,9 @@ class TestNaturalTypedEndpoints:
         result = service.get_natural_by_date_typed(test_date)
 
         # Assert - verify date-specific natural imagery response
+        mock_session.get.assert_called_once_with(
+            "https://epic.gsfc.nasa.gov/api/natural/date/2025-07-15"
+        )
         assert isinstance(result, NaturalImagesResponse)
         assert len(result.root) > 0
         first_image = result.root[0]
@@ -134,7 +142,7 @@ class TestNaturalTypedEndpoints:
         """Test retrieving all available natural color dates as typed models."""
         # Arrange - setup mock response with dates list
         mock_response = Mock()
-        mock_response.json.return_value = natural_all_dates_data
+        mock_response.content = json.dumps(natural_all_dates_data).encode()
         mock_response.raise_for_status.return_value = None
         mock_session.get.return_value = mock_response
 
@@ -156,7 +164,7 @@ class TestEnhancedTypedEndpoints:
         """Test retrieving most recent enhanced color imagery as typed models."""
         # Arrange - setup mock response for enhanced imagery
         mock_response = Mock()
-        mock_response.json.return_value = enhanced_recent_data
+        mock_response.content = json.dumps(enhanced_recent_data).encode()
         mock_response.raise_for_status.return_value = None
         mock_session.get.return_value = mock_response
 
@@ -174,7 +182,7 @@ class TestEnhancedTypedEndpoints:
         # Arrange - setup test date and enhanced mock response
         test_date = "2025-07-15"
         mock_response = Mock()
-        mock_response.json.return_value = enhanced_date_data
+        mock_response.content = json.dumps(enhanced_date_data).encode()
         mock_response.raise_for_status.return_value = None
         mock_session.get.return_value = mock_response
 
@@ -195,7 +203,7 @@ class TestAerosolTypedEndpoints:
         """Test retrieving most recent aerosol index imagery as typed models."""
         # Arrange - setup aerosol data mock response
         mock_response = Mock()
-        mock_response.json.return_value = aerosol_recent_data
+        mock_response.content = json.dumps(aerosol_recent_data).encode()
         mock_response.raise_for_status.return_value = None
         mock_session.get.return_value = mock_response
 
@@ -213,7 +221,7 @@ class TestAerosolTypedEndpoints:
         # Arrange - setup date parameter and aerosol mock
         test_date = "2025-01-14"
         mock_response = Mock()
-        mock_response.json.return_value = aerosol_recent_data
+        mock_response.content = json.dumps(aerosol_recent_data).encode()
         mock_response.raise_for_status.return_value = None
         mock_session.get.return_value = mock_response
 
@@ -234,7 +242,7 @@ class TestCloudTypedEndpoints:
         """Test retrieving most recent cloud fraction imagery as typed models."""
         # Arrange - setup cloud data mock response
         mock_response = Mock()
-        mock_response.json.return_value = cloud_recent_data
+        mock_response.content = json.dumps(cloud_recent_data).encode()
         mock_response.raise_for_status.return_value = None
         mock_session.get.return_value = mock_response
 
@@ -252,7 +260,7 @@ class TestCloudTypedEndpoints:
         # Arrange - setup date and cloud fraction mock
         test_date = "2025-01-14"
         mock_response = Mock()
-        mock_response.json.return_value = cloud_recent_data
+        mock_response.content = json.dumps(cloud_recent_data).encode()
         mock_response.raise_for_status.return_value = None
         mock_session.get.return_value = mock_response
 
@@ -273,7 +281,7 @@ class TestTypedValidation:
         """Test typed methods handle empty responses correctly."""
         # Arrange - setup empty response
         mock_response = Mock()
-        mock_response.json.return_value = []
+        mock_response.content = json.dumps([]).encode()
         mock_response.raise_for_status.return_value = None
         mock_session.get.return_value = mock_response
 
@@ -284,3 +292,198 @@ class TestTypedValidation:
         assert isinstance(result, NaturalImagesResponse)
         assert isinstance(result.root, list)
         assert len(result.root) == 0
+
+
+class TestResponseCache:
+    """Test on-disk caching of by-date responses."""
+
+    def test_past_date_served_from_cache(self, mock_session, natural_recent_data, tmp_path):
+        """Test a settled past date is fetched once and then read from the cache."""
+        # Arrange - service with a cache directory and a single API response
+        service = EpicApiService(session=mock_session, cache_dir=tmp_path)
+        mock_response = Mock()
+        mock_response.content = json.dumps(natural_recent_data).encode()
+        mock_response.raise_for_status.return_value = None
+        mock_session.get.return_value = mock_response
+
+        # Act - request the same date twice
+        first = service.get_natural_by_date_typed("2024-10-01")
+        second = service.get_natural_by_date_typed("2024-10-01")
+
+        # Assert - only the first call reaches the API and both results match
+        mock_session.get.assert_called_once()
+        assert (tmp_path / EpicApiService.CACHE_VERSION / "natural" / "2024-10-01.json").exists()
+        assert second == first
+
+    def test_recent_date_not_cached(self, mock_session, natural_recent_data, tmp_path):
+        """Test dates that may still receive new imagery always hit the API."""
+        # Arrange - service with a cache directory and today's date
+        service = EpicApiService(session=mock_session, cache_dir=tmp_path)
+        today = datetime.now(tz=timezone.utc).strftime("%Y-%m-%d")
+        mock_response = Mock()
+        mock_response.content = json.dumps(natural_recent_data).encode()
+        mock_response.raise_for_status.return_value = None
+        mock_session.get.return_value = mock_response
+
+        # Act - request today's metadata twice
+        service.get_natural_by_date_typed(today)
+        service.get_natural_by_date_typed(today)
+
+        # Assert - nothing cached, both calls reached the API
+        assert mock_session.get.call_count == 2
+        assert not (tmp_path / EpicApiService.CACHE_VERSION / "natural").exists()
+
+    def test_invalid_cached_copy_refetched(self, mock_session, natural_recent_data, tmp_path):
+        """Test a cached body that no longer validates is replaced from the API."""
+        # Arrange - corrupted cache entry for a settled date
+        cache_file = tmp_path / EpicApiService.CACHE_VERSION / "natural" / "2024-10-01.json"
+        cache_file.parent.mkdir(parents=True)
+        cache_file.write_bytes(b'{"error": "maintenance"}')
+        service = EpicApiService(session=mock_session, cache_dir=tmp_path)
+        body = json.dumps(natural_recent_data).encode()
+        mock_response = Mock()
+        mock_response.content = body
+        mock_response.raise_for_status.return_value = None
+        mock_session.get.return_value = mock_response
+
+        # Act
+        result = service.get_natural_by_date_typed("2024-10-01")
+
+        # Assert - the API was queried and the cache entry overwritten
+        mock_session.get.assert_called_once()
+        assert len(result.root) == len(natural_recent_data)
+        assert cache_file.read_bytes() == body
+
+    def test_unreadable_cached_copy_refetched(self, mock_session, natural_recent_data, tmp_path):
+        """Test a cache entry that cannot be read falls back to the API."""
+        # Arrange - a directory where the cache file should be
+        cache_file = tmp_path / EpicApiService.CACHE_VERSION / "natural" / "2024-10-01.json"
+        cache_file.mkdir(parents=True)
+        service = EpicApiService(session=mock_session, cache_dir=tmp_path)
+        mock_response = Mock()
+        mock_response.content = json.dumps(natural_recent_data).encode()
+        mock_response.raise_for_status.return_value = None
+        mock_session.get.return_value = mock_response
+
+        # Act
+        result = service.get_natural_by_date_typed("2024-10-01")
+
+        # Assert
+        mock_session.get.assert_called_once()
+        assert len(result.root) == len(natural_recent_data)
+
+    def test_invalid_body_not_cached(self, mock_session, tmp_path):
+        """Test a body that fails validation is never written to the cache."""
+        # Arrange - service with a cache directory and an error body returned with HTTP 200
+        service = EpicApiService(session=mock_session, cache_dir=tmp_path)
+        mock_response = Mock()
+        mock_response.content = b'{"error": "maintenance"}'
+        mock_response.raise_for_status.return_value = None
+        mock_session.get.return_value = mock_response
+
+        # Act & Assert - validation fails and nothing is cached
+        with pytest.raises(ValidationError):
+            service.get_natural_by_date_typed("2024-10-01")
+        assert not (
+            tmp_path / EpicApiService.CACHE_VERSION / "natural" / "2024-10-01.json"
+        ).exists()
+
+    def test_unwritable_cache_does_not_fail_request(
+        self, mock_session, natural_recent_data, tmp_path
+    ):
+        """Test a cache directory that cannot be created still returns the response."""
+        # Arrange - cache directory path occupied by a regular file
+        cache_dir = tmp_path / "cache"
+        cache_dir.write_text("not a directory")
+        service = EpicApiService(session=mock_session, cache_dir=cache_dir)
+        mock_response = Mock()
+        mock_response.content = json.dumps(natural_recent_data).encode()
+        mock_response.raise_for_status.return_value = None
+        mock_session.get.return_value = mock_response
+
+        # Act
+        result = service.get_natural_by_date_typed("2024-10-01")
+
+        # Assert - fetched response is returned despite the failed cache write
+        assert isinstance(result, NaturalImagesResponse)
+        assert len(result.root) == len(natural_recent_data)
+
+    def test_cache_write_leaves_no_temporary_files(
+        self, mock_session, natural_recent_data, tmp_path
+    ):
+        """Test the cache holds only the final file once a response is stored."""
+        # Arrange
+        service = EpicApiService(session=mock_session, cache_dir=tmp_path)
+        mock_response = Mock()
+        mock_response.content = json.dumps(natural_recent_data).encode()
+        mock_response.raise_for_status.return_value = None
+        mock_session.get.return_value = mock_response
+
+        # Act
+        service.get_natural_by_date_typed("2024-10-01")
+
+        # Assert
+        assert [
+            path.name for path in (tmp_path / EpicApiService.CACHE_VERSION / "natural").iterdir()
+        ] == ["2024-10-01.json"]
+
+
+class TestBatchedRetrieval:
+    """Test retrieving several collections and dates in one call."""
+
+    def test_get_many_dedupes_keys(
+        self, service, mock_session, natural_recent_data, aerosol_recent_data
+    ):
+        """Test repeated keys share one request and each collection gets its model."""
+        # Arrange - responses chosen by the requested collection
+        bodies = {
+            "natural": json.dumps(natural_recent_data).encode(),
+            "aerosol": json.dumps(aerosol_recent_data).encode(),
+        }
+
+        def get(url):
+            response = Mock()
+            response.content = bodies[url.split("/")[-3]]
+            response.raise_for_status.return_value = None
+            return response
+
+        mock_session.get.side_effect = get
+        keys = [
+            ("natural", "2024-10-01"),
+            ("aerosol", "2024-10-01"),
+            ("natural", "2024-10-01"),
+        ]
+
+        # Act
+        result = service.get_many(keys)
+
+        # Assert - one request per distinct key, typed by collection
+        assert mock_session.get.call_count == 2
+        assert list(result) == [("natural", "2024-10-01"), ("aerosol", "2024-10-01")]
+        assert isinstance(result[("natural", "2024-10-01")], NaturalImagesResponse)
+        assert isinstance(result[("aerosol", "2024-10-01")], AerosolImagesResponse)
+
+    def test_get_many_workers_capped_at_pool_size(self, service, mock_session, monkeypatch):
+        """Test get_many never runs more requests than the connection pool holds."""
+        # Arrange - record the worker count the thread pool is created with
+        pool_sizes = []
+
+        class RecordingExecutor(ThreadPoolExecutor):
+            def __init__(self, max_workers=None):
+                pool_sizes.append(max_workers)
+                super().__init__(max_workers=max_workers)
+
+        monkeypatch.setattr(service_module, "ThreadPoolExecutor", RecordingExecutor)
+
+        # Act
+        service.get_many([], max_workers=EpicApiClient.POOL_MAXSIZE * 2)
+
+        # Assert
+        assert pool_sizes == [EpicApiClient.POOL_MAXSIZE]
+
+    def test_get_many_unknown_collection(self, service, mock_session):
+        """Test an unknown collection is rejected before any request is made."""
+        # Act & Assert
+        with pytest.raises(ValueError, match="Unknown collection: invalid"):
+            service.get_many([("natural", "2024-10-01"), ("invalid", "2024-10-01")])
+        mock_session.get.assert_not_called()